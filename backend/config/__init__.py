@@ -1 +1,6 @@
-from .sparql_client import get_sparql, execute_query
+from .sparql_client import (
+    get_session,
+    execute_query,
+    get_dataset_version,
+    set_dataset_version,
+)
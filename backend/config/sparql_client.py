@@ -1,73 +1,141 @@
 from __future__ import annotations
 
+import functools
+import json
 import os
-import threading
 from typing import Any, Dict, Optional
 
-from SPARQLWrapper import SPARQLWrapper, JSON, BASIC, DIGEST
+import requests
+from requests.adapters import HTTPAdapter
+from requests.auth import HTTPBasicAuth, HTTPDigestAuth
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+try:
+    # orjson parses SPARQL JSON result sets several times faster than the
+    # stdlib; fall back silently when it is not installed.
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
 load_dotenv()
 
-__sparql_client: Optional[SPARQLWrapper] = None
-__lock = threading.Lock()
+__endpoint: Optional[str] = None
+
+try:
+    _TIMEOUT = int(os.getenv("SPARQL_TIMEOUT", "30"))
+except ValueError:
+    _TIMEOUT = 30
+
+# Fingerprint of the currently-ingested dataset. Caches that key on it
+# (e.g. recipe details) become stale as a group when it changes, without
+# needing an explicit sweep - superseded entries simply stop being hit
+# and age out.
+_DATASET_VERSION = os.getenv("DATASET_VERSION", "0")
+
+
+def get_dataset_version() -> str:
+    """Return the fingerprint of the dataset currently being served."""
+    return _DATASET_VERSION
+
+
+def set_dataset_version(version: str) -> None:
+    """Record that the knowledge graph was re-ingested.
+
+    Bumping the version invalidates every version-keyed cache entry at
+    once and drops the raw query-result cache, whose entries reflect the
+    old data.
+    """
+    global _DATASET_VERSION
+    _DATASET_VERSION = str(version)
+    _execute_query_cached.cache_clear()
+
 
+@functools.lru_cache(maxsize=None)
+def _build_session() -> requests.Session:
+    global __endpoint
 
-def _build_client() -> SPARQLWrapper:
     endpoint = os.environ.get("SPARQL_ENDPOINT")
     if not endpoint:
         raise RuntimeError(
             "SPARQL_ENDPOINT is not set. Define it in your environment or .env file."
         )
-
-    client = SPARQLWrapper(endpoint)
-    client.setReturnFormat(JSON)
-
-    method = (os.getenv("SPARQL_METHOD") or "GET").upper()
-    if method not in {"GET", "POST"}:
-        method = "GET"
-    client.setMethod(method)
-
-    try:
-        timeout = int(os.getenv("SPARQL_TIMEOUT", "30"))
-    except ValueError:
-        timeout = 30
-    try:
-        client.setTimeout(timeout)
-    except Exception:
-        pass
+    __endpoint = endpoint
+
+    session = requests.Session()
+
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.1),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    session.headers.update({
+        "Accept": "application/sparql-results+json",
+        # requests decompresses transparently; result sets shrink 3-10x on
+        # the wire when the endpoint honours this.
+        "Accept-Encoding": "gzip, deflate",
+        # An identifiable agent avoids blanket throttling of anonymous
+        # clients on shared endpoints.
+        "User-Agent": "recipekg-recommender/1.0",
+    })
 
     auth_type = (os.getenv("SPARQL_AUTH_TYPE") or "NONE").upper()
     user = os.getenv("SPARQL_USER")
     password = os.getenv("SPARQL_PASSWORD")
 
     if auth_type == "BASIC" and user and password:
-        client.setCredentials(user, password, realm=None, auth=BASIC)
+        session.auth = HTTPBasicAuth(user, password)
     elif auth_type == "DIGEST" and user and password:
-        client.setCredentials(user, password, realm=None, auth=DIGEST)
+        session.auth = HTTPDigestAuth(user, password)
 
     token = os.getenv("SPARQL_TOKEN")
     if token:
-        headers = {"Authorization": f"Bearer {token}"}
-        try:
-            client.setHTTPAuth("CUSTOM")
-        except Exception:
-            pass
-        client.addCustomHttpHeader("Authorization", f"Bearer {token}")
-        # It is fine to add only the Authorization header; others can be added by callers.
+        session.headers["Authorization"] = f"Bearer {token}"
 
-    return client
+    return session
 
 
-def get_sparql() -> SPARQLWrapper:
-    """Return the global SPARQLWrapper client, creating it on first use.
+def get_session() -> requests.Session:
+    """Return the global pooled HTTP session, creating it on first use.
+
+    The session keeps connections to the SPARQL endpoint alive, so queries
+    after the first skip the TCP/TLS handshake entirely. Construction is
+    deduplicated by lru_cache, so the happy path is a C-level cache hit
+    with no lock acquisition.
     """
-    global __sparql_client
-    if __sparql_client is None:
-        with __lock:
-            if __sparql_client is None:
-                __sparql_client = _build_client()
-    return __sparql_client
+    return _build_session()
+
+
+@functools.lru_cache(maxsize=512)
+def _execute_query_cached(query: str) -> bytes:
+    """Run `query` against the endpoint and return the raw JSON response body.
+
+    The cache stores the serialized bytes rather than the parsed dict, so
+    callers mutating their result can never poison entries for later calls.
+    """
+    session = get_session()
+
+    method = (os.getenv("SPARQL_METHOD") or "POST").upper()
+    # Long queries (many VALUES alternatives) can overflow URL length
+    # limits; send them form-encoded in the body regardless of the
+    # configured method.
+    if len(query) > 2048:
+        method = "POST"
+    if method == "GET":
+        response = session.get(__endpoint, params={"query": query}, timeout=_TIMEOUT)
+    else:
+        response = session.post(__endpoint, data={"query": query}, timeout=_TIMEOUT)
+
+    with response:
+        response.raise_for_status()
+        # Bytes, not text: skips requests' charset decode and feeds the
+        # parser's UTF-8 fast path directly.
+        return response.content
 
 
 def execute_query(query: str) -> Dict[str, Any]:
@@ -75,14 +143,21 @@ def execute_query(query: str) -> Dict[str, Any]:
 
     For SELECT queries, returns a dict with `head` and `results` keys.
     For ASK queries, returns e.g. `{ 'boolean': True }`.
+
+    Identical query strings are served from an in-process LRU cache, so
+    repeated queries skip the network round-trip entirely. Use
+    `execute_query.cache_clear()` to drop cached results.
     """
-    client = get_sparql()
-    client.setQuery(query)
-    result = client.query().convert()
-    return result
+    return _json_loads(_execute_query_cached(query))
+
+
+execute_query.cache_clear = _execute_query_cached.cache_clear  # type: ignore[attr-defined]
+execute_query.cache_info = _execute_query_cached.cache_info  # type: ignore[attr-defined]
 
 
 __all__ = [
-    "get_sparql",
+    "get_session",
     "execute_query",
+    "get_dataset_version",
+    "set_dataset_version",
 ]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import logging
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 
 from dotenv import load_dotenv
 from flask import Flask
@@ -20,9 +22,75 @@ logging.basicConfig(
     force=True
 )
 
-from backend.services import get_ingredient_list
 
-INGREDIENTS = get_ingredient_list()
+class _IngredientFetch:
+    """Shared handle on the background ingredient-list fetch.
+
+    A Future caches its exception for life, so if the startup fetch failed
+    (endpoint briefly down at boot, no fresh disk cache) every later
+    .result() would re-raise it forever. Instead, a failed future is
+    discarded and the fetch re-submitted, so requests start succeeding
+    again as soon as the endpoint recovers; the retry's own failure still
+    propagates to the current request.
+    """
+
+    def __init__(self, fetch):
+        self._fetch = fetch
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._lock = threading.Lock()
+        self._future: Future = self._executor.submit(fetch)
+
+    def result(self):
+        with self._lock:
+            future = self._future
+        try:
+            return future.result()
+        except Exception:
+            with self._lock:
+                # Only re-submit if another request has not already done so.
+                if self._future is future:
+                    self._future = self._executor.submit(self._fetch)
+                retry = self._future
+            return retry.result()
+
+
+class _LazyList:
+    """Sequence proxy over the ingredient fetch; resolves on first use.
+
+    Lets the app start serving /health without blocking on the startup
+    SPARQL fetch. Consumers that iterate or index the list transparently
+    block only if the fetch has not finished yet.
+    """
+
+    def __init__(self, fetch: _IngredientFetch):
+        self._fetch = fetch
+
+    def _resolve(self):
+        return self._fetch.result()
+
+    def __iter__(self):
+        return iter(self._resolve())
+
+    def __len__(self):
+        return len(self._resolve())
+
+    def __getitem__(self, index):
+        return self._resolve()[index]
+
+
+class _LazyMatcher:
+    """Defers building the IngredientMatcher until the first match call."""
+
+    def __init__(self, fetch: _IngredientFetch):
+        self._fetch = fetch
+        self._matcher = None
+
+    def match(self, *args, **kwargs):
+        if self._matcher is None:
+            from backend.services import IngredientMatcher
+
+            self._matcher = IngredientMatcher(list(self._fetch.result()))
+        return self._matcher.match(*args, **kwargs)
 
 
 def create_app() -> Flask:
@@ -33,16 +101,26 @@ def create_app() -> Flask:
         template_folder="templates",
     )
 
-    
     app.config.setdefault("SECRET_KEY", os.getenv("SECRET_KEY", "dev-secret-key"))
     app.config.setdefault(
         "SPARQL_ENDPOINT",
         os.getenv("SPARQL_ENDPOINT", "http://localhost:3030/recipes/sparql"),
     )
 
+    # Imported here (not at module scope) so importing backend.main never
+    # touches the SPARQL endpoint - only building the app does.
+    from backend.services import get_ingredient_list
+
+    # Warm the ingredient list in the background so worker startup is not
+    # serialized behind a SPARQL round-trip.
+    ingredients_fetch = _IngredientFetch(get_ingredient_list)
+    app.config["INGREDIENTS"] = _LazyList(ingredients_fetch)
+    app.config["MATCHER"] = _LazyMatcher(ingredients_fetch)
+
     # Register blueprints
-    from .routes import register_blueprints
+    from .routes import cache, register_blueprints
 
+    cache.init_app(app)
     register_blueprints(app)
 
     @app.context_processor
@@ -50,11 +128,7 @@ def create_app() -> Flask:
         return {
             "app_name": "recipekg-recommender",
             "sparql_endpoint": app.config.get("SPARQL_ENDPOINT"),
-            "possible_ingredients": INGREDIENTS,
+            "possible_ingredients": list(app.config["INGREDIENTS"]),
         }
 
     return app
-
-
-
-app = create_app()
@@ -1 +1,39 @@
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
+
+@dataclass(slots=True)
+class RecipeDetail:
+    """Aggregated detail record for a single recipe.
+
+    Slotted so the ~18 fields live at fixed offsets instead of in a
+    per-instance dict: attribute reads skip the hash lookup and each cached
+    instance is smaller. Jinja resolves attributes before items, so the
+    templates' `recipe.name` style access works unchanged.
+
+    `fsa_score` and `recipe_yield` hold intermediate shapes while the facet
+    merges run (list of values) and are collapsed to their display form
+    (single value or joined string) at the end of aggregation. Ingredient
+    entries and the rating stay plain dicts - they are materialized once at
+    the template boundary and never field-accessed in hot code.
+    """
+
+    uri: str
+    name: Optional[str] = None
+    description: Optional[str] = None
+    usda_score: Optional[str] = None
+    fsa_score: Any = None
+    calories: Optional[str] = None
+    recipe_yield: Any = field(default_factory=list)
+    prep_time: Optional[str] = None
+    cook_time: Optional[str] = None
+    total_time: Optional[str] = None
+    date_published: Optional[str] = None
+    ingredients: List[Dict[str, Any]] = field(default_factory=list)
+    dietary_restrictions: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    rating: Optional[Dict[str, Any]] = None
+    nutritional_info: Dict[str, str] = field(default_factory=dict)
+    serving_size: Optional[str] = None
+    serving_size_unit: Optional[str] = None
+    nutritional_context: str = "per serving"
@@ -3,6 +3,11 @@
 from __future__ import annotations
 
 from flask import Flask
+from flask_caching import Cache
+
+# Shared response cache for the view functions; bound to the app in
+# create_app via cache.init_app(app).
+cache = Cache(config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300})
 
 
 def register_blueprints(app: Flask) -> None:
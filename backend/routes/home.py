@@ -2,10 +2,12 @@ from __future__ import annotations
 
 from typing import List
 
-from flask import Blueprint, render_template, jsonify, request
+import json
 
-from backend.main import INGREDIENTS
-from backend.services import fetch_recipes_by_ingredients, get_matched_ingredients_only, match_ingredients
+from flask import Blueprint, Response, current_app, render_template, jsonify, request, stream_with_context
+
+from backend.routes import cache
+from backend.services import fetch_recipes_by_ingredients
 
 bp = Blueprint("home", __name__)
 
@@ -13,31 +15,48 @@ bp = Blueprint("home", __name__)
 def _parse_ingredients(arg: str | None) -> List[str]:
     if not arg:
         return []
-    items = [part.strip() for part in arg.split(",")]
-    # items = [i.title() for i in items if i]
+    # dict.fromkeys dedupes at C speed while preserving input order, so the
+    # same ingredient string always yields the same SPARQL query (and
+    # therefore hits the execute_query cache).
+    return list(dict.fromkeys(part.strip() for part in arg.split(",") if part.strip()))
+
+
+# Removes double quotes; str.translate is C-coded and faster than .replace
+# for single-character removal.
+_QUOTES = str.maketrans("", "", '"')
+
+
+def _ingredient_groups(input_ingredients: List[str]) -> List[List[str]]:
+    """Match the raw input tokens and return the non-empty match groups."""
+    if not input_ingredients:
+        return []
+    ingredient_matches = current_app.config["MATCHER"].match(
+        input_ingredients,
+        cutoff=0.6,
+        high_similarity_threshold=0.8,
+        max_matches=2
+    )
+    return [matched_list for _, matched_list in ingredient_matches if matched_list]
 
-    return list(set(items))
+
+def _clean_row(b: dict) -> dict:
+    """Flatten one SPARQL candidate binding into a plain recipe dict."""
+    return {
+        "uri": b["recipe"]["value"],
+        "name": b["name"]["value"].translate(_QUOTES),
+        "usda_score": b["usdascore"]["value"],
+        "calories": b["calAmount"]["value"],
+    }
 
 
 @bp.route("/")
+@cache.cached(query_string=True, unless=lambda: bool(request.args.get("no_cache")))
 def index():
     input_ingredients = _parse_ingredients(request.args.get("ingredients"))
     sort_option = request.args.get("sort", "usda_desc")  # default
 
-    ingredient_matches = match_ingredients(
-        input_ingredients, 
-        INGREDIENTS, 
-        cutoff=0.6, 
-        high_similarity_threshold=0.8,
-        max_matches=2
-    ) if input_ingredients else []
-    
-    ingredient_groups = [matched_list for _, matched_list in ingredient_matches if matched_list]
-    
-    matched_ingredients = []
-    for matched_list in ingredient_groups:
-        matched_ingredients.extend(matched_list)
-    
+    ingredient_groups = _ingredient_groups(input_ingredients)
+
     recipes = fetch_recipes_by_ingredients(ingredient_groups, sort_option=sort_option) if ingredient_groups else None
     
     return render_template(
@@ -50,6 +69,37 @@ def index():
     )
 
 
+@bp.route("/api/recipes")
+def recipes():
+    input_ingredients = _parse_ingredients(request.args.get("ingredients"))
+    sort_option = request.args.get("sort", "usda_desc")
+
+    ingredient_groups = _ingredient_groups(input_ingredients)
+
+    data = fetch_recipes_by_ingredients(ingredient_groups, sort_option=sort_option) if ingredient_groups else None
+    bindings = data["results"]["bindings"] if data and "results" in data else []
+
+    # Stream the payload row by row: the cleaned list and the full serialized
+    # body never exist in memory at once, and the first bytes go out before
+    # the last row is processed.
+    def generate():
+        yield '{"ingredients": %s, "matched_groups": %s, "recipes": [' % (
+            json.dumps(input_ingredients),
+            json.dumps(ingredient_groups),
+        )
+        first = True
+        for b in bindings:
+            if "recipe" not in b or "name" not in b:
+                continue
+            if not first:
+                yield ","
+            yield json.dumps(_clean_row(b))
+            first = False
+        yield "]}"
+
+    return Response(stream_with_context(generate()), mimetype="application/json")
+
+
 @bp.route("/health")
 def health():
     return jsonify(status="ok")
@@ -26,6 +26,6 @@ def detail(recipe_uri: str):
     return render_template(
         "recipe_detail.html",
         recipe=recipe,
-        title=recipe.get("name", "Recipe Details")
+        title=recipe.name or "Recipe Details"
     )
 
@@ -1,4 +1,7 @@
+import json
 import logging
+import os
+import time
 
 from backend.config import execute_query
 
@@ -21,14 +24,60 @@ WHERE {
 ORDER BY ?ingredient
 """
 
+_CACHE_PATH = os.getenv("INGREDIENT_CACHE_PATH", os.path.join("cache", "ingredients.json"))
+
+try:
+    _CACHE_TTL = int(os.getenv("INGREDIENT_CACHE_TTL", "86400"))
+except ValueError:
+    _CACHE_TTL = 86400
+
+
+def _load_cached_ingredients():
+    """Return the cached ingredient tuple if the cache file is fresh, else None."""
+    if _CACHE_TTL <= 0:
+        return None
+    try:
+        if time.time() - os.path.getmtime(_CACHE_PATH) >= _CACHE_TTL:
+            return None
+        with open(_CACHE_PATH) as f:
+            return tuple(json.load(f))
+    except (OSError, ValueError):
+        return None
+
 
 def get_ingredient_list():
+    """Return all ingredient names known to the knowledge graph, as a tuple.
+
+    The result is persisted to a JSON file (INGREDIENT_CACHE_PATH, TTL via
+    INGREDIENT_CACHE_TTL seconds) so worker restarts and dev-server reloads
+    skip the startup SPARQL round-trip while the cache is fresh.
+    """
+    cached = _load_cached_ingredients()
+    if cached is not None:
+        logging.info("Loaded %d ingredients from cache at %s", len(cached), _CACHE_PATH)
+        return cached
+
     logging.info("Fetching ingredient list...")
     sparql_dict = execute_query(query)
 
-    ingredients = [
+    ingredients = tuple(
         i["ingredient"]["value"].replace("*", "")
         for i in sparql_dict["results"]["bindings"]
-    ]
+    )
+
+    if _CACHE_TTL > 0:
+        try:
+            cache_dir = os.path.dirname(_CACHE_PATH)
+            if cache_dir:
+                os.makedirs(cache_dir, exist_ok=True)
+            with open(_CACHE_PATH, "w") as f:
+                json.dump(list(ingredients), f)
+        except OSError as e:
+            logging.warning("Could not write ingredient cache to %s: %s", _CACHE_PATH, e)
 
     return ingredients
+
+
+def get_ingredient_set():
+    """Return the known ingredients as a frozenset for O(1) membership tests."""
+    return frozenset(get_ingredient_list())
@@ -1,23 +1,63 @@
+import functools
 import logging
-from typing import List, Tuple, Optional
+from collections import defaultdict
+from typing import List, Sequence, Tuple
 from difflib import SequenceMatcher, get_close_matches
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # pragma: no cover - rapidfuzz is in requirements.txt
+    fuzz = process = None
+
 logger = logging.getLogger(__name__)
 
 
-def _calculate_similarity(s1: str, s2: str) -> float:
-    """Calculate similarity ratio between two strings."""
-    return SequenceMatcher(None, s1, s2).ratio()
+if process is not None:
+
+    def _calculate_similarity(s1: str, s2: str) -> float:
+        """Calculate similarity ratio between two strings."""
+        return fuzz.ratio(s1, s2) / 100.0
+
+    def _scored_matches(word: str, candidates: Sequence[str], n: int, cutoff: float) -> List[Tuple[str, float]]:
+        """Return up to `n` (candidate, score) pairs scoring at least `cutoff` against `word`.
+
+        RapidFuzz prunes candidates internally via `score_cutoff`, so this is
+        one to two orders of magnitude faster than difflib's pure-Python scan.
+        """
+        return [
+            (candidate, score / 100.0)
+            for candidate, score, _idx in process.extract(
+                word, candidates, scorer=fuzz.ratio, score_cutoff=cutoff * 100, limit=n
+            )
+        ]
+
+else:
+
+    def _calculate_similarity(s1: str, s2: str) -> float:
+        """Calculate similarity ratio between two strings."""
+        return SequenceMatcher(None, s1, s2).ratio()
+
+    def _scored_matches(word: str, candidates: Sequence[str], n: int, cutoff: float) -> List[Tuple[str, float]]:
+        """Return up to `n` (candidate, score) pairs scoring at least `cutoff` against `word`."""
+        return [
+            (candidate, _calculate_similarity(word, candidate))
+            for candidate in get_close_matches(word, candidates, n=n, cutoff=cutoff)
+        ]
 
 
-def _normalize_plural(word: str) -> List[str]:
+@functools.lru_cache(maxsize=8192)
+def _normalize_plural(word: str) -> Tuple[str, ...]:
     """
     Generate normalized forms of a word for pluralization matching.
-    Returns a list of possible forms: original, singular, plural.
+    Returns a tuple of possible forms: original, singular, plural.
+
+    Results are memoized: the same tokens recur across requests (and the
+    matched-ingredient lookups inside the matcher), so repeat calls are a
+    single dict lookup.
     """
     word = word.lower().strip()
     forms = [word]
-    
+
     # Try to get singular form (remove common plural endings)
     if word.endswith('ies'):
         forms.append(word[:-3] + 'y')
@@ -27,142 +67,221 @@ def _normalize_plural(word: str) -> List[str]:
             forms.append(word[:-1])
     elif word.endswith('s') and len(word) > 1:
         forms.append(word[:-1])
-    
+
     # Try to get plural forms
     if not word.endswith('s'):
         forms.append(word + 's')
     if word.endswith('y') and len(word) > 1:
         forms.append(word[:-1] + 'ies')
-    elif word.endswith('o') or (word.endswith('ch') or word.endswith('sh') or word.endswith('x')):
-        if not word.endswith('es'):
-            forms.append(word + 'es')
-    
-    return list(set(forms))
+    elif word.endswith(('o', 'ch', 'sh', 'x')) and not word.endswith('es'):
+        forms.append(word + 'es')
 
+    return tuple(dict.fromkeys(forms))
 
-def match_ingredients(
-    input_ingredients: List[str],
-    available_ingredients: List[str],
-    cutoff: float = 0.6,
-    high_similarity_threshold: float = 0.6,
-    max_matches: int = 10
-) -> List[Tuple[str, List[str]]]:
+
+class IngredientMatcher:
     """
-    Match input ingredients to available ingredients in the knowledge graph.
-    Returns multiple matches when similarity is high.
-    
-    Args:
-        input_ingredients: List of user-provided ingredient names (may contain typos/variations)
-        available_ingredients: List of valid ingredients from the knowledge graph
-        cutoff: Minimum similarity threshold (0.0 to 1.0). Matches below this are ignored.
-        high_similarity_threshold: Threshold for high similarity (0.0 to 1.0). 
-                                   When matches are above this, all high-similarity matches are returned.
-        max_matches: Maximum number of matches to consider per input ingredient
-    
-    Returns:
-        List of tuples (input_ingredient, [matched_ingredients]), where matched_ingredients
-        is a list of matched ingredient names (empty list if no match found).
-        If multiple matches have similarity >= high_similarity_threshold, all such matches are returned.
-        Otherwise, only the best match is returned (if above cutoff).
+    Matches user-provided ingredient names (typos, plural variants, ...)
+    against the list of ingredients known to the knowledge graph.
+
+    The matcher is meant to be built once at startup: the case-insensitive
+    lookup table over the available ingredients is computed a single time in
+    `__init__` instead of on every request, and per-token match results are
+    memoized so repeated inputs short-circuit to a cache lookup.
     """
-    # Normalize available ingredients for case-insensitive matching
-    normalized_available = {ing.lower(): ing for ing in available_ingredients}
-    available_lower = list(normalized_available.keys())
-    
-    matches = []
-    
-    for input_ingredient in input_ingredients:
+
+    # Below this many bucketed candidates, fuzzy-match against the full list
+    # instead (the input's first character is probably itself a typo).
+    _MIN_BUCKET_CANDIDATES = 20
+
+    def __init__(self, available_ingredients: List[str]):
+        self._norm = {ing.lower(): ing for ing in available_ingredients}
+        self._keys = tuple(self._norm.keys())
+        self._by_prefix = defaultdict(list)
+        for key in self._keys:
+            self._by_prefix[key[0]].append(key)
+        self._match_single = functools.lru_cache(maxsize=4096)(self._match_single_uncached)
+
+    def _fuzzy_candidates(self, input_lower: str, input_variants: Sequence[str]) -> Sequence[str]:
+        """Restrict fuzzy scanning to the first-character buckets of the input
+        and its plural variants; close matches almost always share a leading
+        character, so this cuts the candidate pool by roughly the alphabet
+        size. Falls back to the full key list when the buckets are too thin.
+        """
+        prefixes = {variant[0] for variant in input_variants if variant}
+        if input_lower:
+            prefixes.add(input_lower[0])
+
+        candidates: List[str] = []
+        for prefix in prefixes:
+            candidates.extend(self._by_prefix.get(prefix, ()))
+
+        if len(candidates) < self._MIN_BUCKET_CANDIDATES:
+            return self._keys
+        return candidates
+
+    def match(
+        self,
+        input_ingredients: List[str],
+        cutoff: float = 0.6,
+        high_similarity_threshold: float = 0.6,
+        max_matches: int = 10
+    ) -> List[Tuple[str, List[str]]]:
+        """
+        Match input ingredients to available ingredients in the knowledge graph.
+        Returns multiple matches when similarity is high.
+
+        Args:
+            input_ingredients: List of user-provided ingredient names (may contain typos/variations)
+            cutoff: Minimum similarity threshold (0.0 to 1.0). Matches below this are ignored.
+            high_similarity_threshold: Threshold for high similarity (0.0 to 1.0).
+                                       When matches are above this, all high-similarity matches are returned.
+            max_matches: Maximum number of matches to consider per input ingredient
+
+        Returns:
+            List of tuples (input_ingredient, [matched_ingredients]), where matched_ingredients
+            is a list of matched ingredient names (empty list if no match found).
+            If multiple matches have similarity >= high_similarity_threshold, all such matches are returned.
+            Otherwise, only the best match is returned (if above cutoff).
+        """
+        return [
+            (
+                input_ingredient,
+                list(self._match_single(
+                    input_ingredient, cutoff, high_similarity_threshold, max_matches
+                )),
+            )
+            for input_ingredient in input_ingredients
+        ]
+
+    def _match_single_uncached(
+        self,
+        input_ingredient: str,
+        cutoff: float,
+        high_similarity_threshold: float,
+        max_matches: int
+    ) -> Tuple[str, ...]:
+        """Match a single input token; memoized via `self._match_single`."""
         input_lower = input_ingredient.lower().strip()
-        
-        logger.debug("Processing input ingredient: '%s' (lower: '%s')", input_ingredient, input_lower)
-        
+
+        # Checked once per token: the logging machinery is measurable when
+        # these calls fire for every candidate in the loop below.
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Processing input ingredient: '%s' (lower: '%s')", input_ingredient, input_lower)
+
         input_variants = _normalize_plural(input_ingredient)
         matched_ingredients_set = set()
-        
+
         # First, try exact match (case-insensitive)
-        if input_lower in normalized_available:
-            matched_ing = normalized_available[input_lower]
+        if input_lower in self._norm:
+            matched_ing = self._norm[input_lower]
             matched_ingredients_set.add(matched_ing)
-            logger.debug("Found direct exact match for '%s' -> '%s'", input_ingredient, matched_ing)
-            
+            if debug:
+                logger.debug("Found direct exact match for '%s' -> '%s'", input_ingredient, matched_ing)
+
             # Also check for plural/singular variants of the matched ingredient in KG
             matched_variants = _normalize_plural(matched_ing)
             for variant in matched_variants:
-                if variant in normalized_available:
-                    matched_ingredients_set.add(normalized_available[variant])
-            logger.debug("Including variants of matched ingredient: %s", matched_ingredients_set)
-        
+                if variant in self._norm:
+                    matched_ingredients_set.add(self._norm[variant])
+            if debug:
+                logger.debug("Including variants of matched ingredient: %s", matched_ingredients_set)
+
         # Try pluralization variants for exact match
         if not matched_ingredients_set:
-            logger.debug("Generated variants for '%s': %s", input_ingredient, input_variants)
+            if debug:
+                logger.debug("Generated variants for '%s': %s", input_ingredient, input_variants)
             for variant in input_variants:
-                if variant in normalized_available:
-                    matched_ing = normalized_available[variant]
+                if variant in self._norm:
+                    matched_ing = self._norm[variant]
                     matched_ingredients_set.add(matched_ing)
-                    logger.debug("Found exact match via variant - input '%s' -> variant '%s' -> KG '%s'", 
-                                input_ingredient, variant, matched_ing)
-                    
+                    if debug:
+                        logger.debug("Found exact match via variant - input '%s' -> variant '%s' -> KG '%s'",
+                                    input_ingredient, variant, matched_ing)
+
                     # Also check for plural/singular variants of the matched ingredient in KG
                     matched_variants = _normalize_plural(matched_ing)
                     for matched_variant in matched_variants:
-                        if matched_variant in normalized_available:
-                            matched_ingredients_set.add(normalized_available[matched_variant])
+                        if matched_variant in self._norm:
+                            matched_ingredients_set.add(self._norm[matched_variant])
                     break
-        
+
         if matched_ingredients_set:
-            matches.append((input_ingredient, list(matched_ingredients_set)))
-            continue
-        
-        # Get potential matches with fuzzy matching
-        all_candidates = set()
-        for variant in input_variants:
-            close_matches = get_close_matches(
-                variant,
-                available_lower,
-                n=max_matches,
-                cutoff=cutoff
-            )
-            all_candidates.update(close_matches)
-        
-        direct_matches = get_close_matches(
+            return tuple(matched_ingredients_set)
+
+        # Cheap substring pass: a containment hit that differs by at most one
+        # character in eight - a trailing-character typo or truncation, e.g.
+        # 'tomatoes' vs 'tomatoe' (7/8 = 0.875) - is accepted without any
+        # fuzzy scoring. Shorter stems like 'tomato' vs 'tomatoe' (6/7) still
+        # fall through to the fuzzy pass below.
+        for key, original in self._norm.items():
+            if input_lower in key or key in input_lower:
+                shorter, longer = sorted((len(input_lower), len(key)))
+                if longer and shorter / longer >= 0.875:
+                    matched_ingredients_set.add(original)
+
+        if matched_ingredients_set:
+            if debug:
+                logger.debug("Found substring match(es) for '%s': %s", input_ingredient, matched_ingredients_set)
+            return tuple(matched_ingredients_set)
+
+        # Single fuzzy pass over the input itself; the scores come straight
+        # from the matcher, so candidates are not re-scored afterwards.
+        scored = _scored_matches(
             input_lower,
-            available_lower,
+            self._fuzzy_candidates(input_lower, input_variants),
             n=max_matches,
             cutoff=cutoff
         )
-        all_candidates.update(direct_matches)
-
-        logger.debug("Close matches for '%s': %s", input_ingredient, list(all_candidates))
-        
-        if not all_candidates:
-            matches.append((input_ingredient, []))
-            continue
-        
-        # Calculate similarity for each candidate match
+
+        if debug:
+            logger.debug("Close matches for '%s': %s", input_ingredient, scored)
+
+        if not scored:
+            return ()
+
+        # Plural variants are only consulted to promote candidates whose
+        # primary score falls short of the high-similarity threshold.
+        variants = frozenset(input_variants)
         match_similarities = []
-        for candidate_lower in all_candidates:
-            best_similarity = max(
-                _calculate_similarity(input_lower, candidate_lower),
-                *[_calculate_similarity(variant, candidate_lower) for variant in input_variants]
-            )
-            match_similarities.append((candidate_lower, best_similarity))
-        
+        for candidate_lower, similarity in scored:
+            if similarity < high_similarity_threshold:
+                similarity = max(
+                    similarity,
+                    max(_calculate_similarity(variant, candidate_lower) for variant in variants),
+                )
+            match_similarities.append((candidate_lower, similarity))
+
         match_similarities.sort(key=lambda x: x[1], reverse=True)
-        
+
         # Check if we have high similarity matches
         high_similarity_matches = [
-            normalized_available[matched_lower]
+            self._norm[matched_lower]
             for matched_lower, similarity in match_similarities
             if similarity >= high_similarity_threshold
         ]
-        
+
         if high_similarity_matches:
-            matches.append((input_ingredient, high_similarity_matches))
-        else:
-            best_match = normalized_available[match_similarities[0][0]]
-            matches.append((input_ingredient, [best_match]))
-    
-    return matches
+            return tuple(high_similarity_matches)
+        return (self._norm[match_similarities[0][0]],)
+
+
+def match_ingredients(
+    input_ingredients: List[str],
+    available_ingredients: List[str],
+    cutoff: float = 0.6,
+    high_similarity_threshold: float = 0.6,
+    max_matches: int = 10
+) -> List[Tuple[str, List[str]]]:
+    """
+    Convenience wrapper around `IngredientMatcher` for ad-hoc ingredient lists.
+
+    Prefer building an `IngredientMatcher` once and reusing it; this rebuilds
+    the lookup table on every call.
+    """
+    matcher = IngredientMatcher(available_ingredients)
+    return matcher.match(input_ingredients, cutoff, high_similarity_threshold, max_matches)
 
 
 def get_matched_ingredients_only(
@@ -174,24 +293,23 @@ def get_matched_ingredients_only(
     """
     Get only the successfully matched ingredients (flattens all matches).
     If multiple high-similarity matches exist, all are included.
-    
+
     Args:
         input_ingredients: List of user-provided ingredient names
         available_ingredients: List of valid ingredients from the knowledge graph
         cutoff: Minimum similarity threshold (0.0 to 1.0)
         high_similarity_threshold: Threshold for high similarity (0.0 to 1.0)
-    
+
     Returns:
         List of matched ingredient names (all successful matches, flattened)
     """
     matches = match_ingredients(
-        input_ingredients, 
-        available_ingredients, 
-        cutoff, 
+        input_ingredients,
+        available_ingredients,
+        cutoff,
         high_similarity_threshold
     )
     matched = []
     for _, matched_list in matches:
         matched.extend(matched_list)
     return matched
-
@@ -1,4 +1,5 @@
 import logging
+from string import Template
 from typing import List, Optional
 
 from ..config import execute_query
@@ -7,17 +8,41 @@ logger = logging.getLogger(__name__)
 
 
 class RecipeQueryBuilder:
-    PREFIXES = """
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX schema: <https://schema.org/>
-        PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
-        PREFIX recipeKG: <http://purl.org/recipekg/>
-        PREFIX healsIng: <http://purl.org/heals/ingredient/>
-        PREFIX recipeIng: <http://purl.org/recipekg/ingredient/>
-        PREFIX categories: <http://purl.org/recipekg/categories/>
-        PREFIX food: <http://purl.org/heals/food/>
-    """
+    # Kept flush-left: the prefix block is shipped with every query, so no
+    # need to pad each line with indentation bytes.
+    PREFIXES = """\
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+PREFIX schema: <https://schema.org/>
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+PREFIX recipeKG: <http://purl.org/recipekg/>
+PREFIX healsIng: <http://purl.org/heals/ingredient/>
+PREFIX recipeIng: <http://purl.org/recipekg/ingredient/>
+PREFIX categories: <http://purl.org/recipekg/categories/>
+PREFIX food: <http://purl.org/heals/food/>
+"""
+
+    # Compiled once at import; build_query only substitutes the small
+    # per-request deltas. Template uses $-placeholders, so the SPARQL braces
+    # need no escaping.
+    _QUERY_TEMPLATE = Template(PREFIXES + """
+SELECT ?recipe ?name ?usdascore ?calAmount
+WHERE {
+    {
+        SELECT DISTINCT ?recipe ?usdascore ?calAmount
+        WHERE {
+            ?recipe a   schema:Recipe ;
+                        recipeKG:hasUSDAScore ?usdascore ;
+                        recipeKG:hasNutritionalInformation/recipeKG:hasCalorificData/recipeKG:hasAmount ?calAmount .
+            $filters$diet
+        }
+        ORDER BY $order_by
+        LIMIT 1000
+    }
+    ?recipe schema:name ?name .
+}
+ORDER BY $order_by
+""")
 
     DIETARY_PREFERENCES = {
         'vegan': 'recipeKG:Vegan',
@@ -32,7 +57,12 @@ class RecipeQueryBuilder:
         """
         Build ingredient filters where each group represents alternatives (OR logic).
         Groups are combined with AND logic.
-        
+
+        Each group becomes a single triple pattern constrained by a VALUES
+        clause listing the alternative ingredient types (in both ingredient
+        namespaces), so the engine answers it with one index scan per group
+        instead of one sub-plan per UNION branch.
+
         Args:
             ingredient_groups: List of lists, where each inner list contains alternative
                              ingredient names that should be combined with OR.
@@ -46,43 +76,21 @@ class RecipeQueryBuilder:
         for group_idx, ingredient_group in enumerate(ingredient_groups):
             if not ingredient_group:
                 continue
-                
-            if len(ingredient_group) == 1:
-                # Single ingredient - no OR needed
-                ingredient_var = f"?ing{group_idx}"
-                ingredient_name = ingredient_group[0]
-                filters.append(f"""
-        ?recipe food:hasIngredient {ingredient_var} .
-        {ingredient_var} rdf:type ?ingType{group_idx} .
-        FILTER (
-            STRSTARTS(STR(?ingType{group_idx}), STR(healsIng:)) ||
-            STRSTARTS(STR(?ingType{group_idx}), STR(recipeIng:))
-        )
-        FILTER (
-            REPLACE(STR(?ingType{group_idx}), "^.*/", "") = "{ingredient_name}"
-        )
-        """)
-            else:
-                # Multiple alternatives - use UNION for OR logic
-                union_parts = []
-                for alt_idx, ingredient in enumerate(ingredient_group):
-                    ingredient_var = f"?ing{group_idx}_{alt_idx}"
-                    union_parts.append(f"""            {{
-                ?recipe food:hasIngredient {ingredient_var} .
-                {ingredient_var} rdf:type ?ingType{group_idx}_{alt_idx} .
-                FILTER (
-                    STRSTARTS(STR(?ingType{group_idx}_{alt_idx}), STR(healsIng:)) ||
-                    STRSTARTS(STR(?ingType{group_idx}_{alt_idx}), STR(recipeIng:))
-                )
-                FILTER (
-                    REPLACE(STR(?ingType{group_idx}_{alt_idx}), "^.*/", "") = "{ingredient}"
-                )
-            }}""")
-                
-                filters.append(f"""
-        {{
-            {' UNION '.join(union_parts)}
-        }}
+
+            # Full IRIs, not prefixed names: ingredient names are KG URI
+            # tails and can contain characters that are legal inside an
+            # IRIREF but not in an unescaped PN_LOCAL (quotes, parens,
+            # commas, a trailing dot), which would make the whole query a
+            # syntax error.
+            values = " ".join(
+                f"<http://purl.org/heals/ingredient/{ingredient}> "
+                f"<http://purl.org/recipekg/ingredient/{ingredient}>"
+                for ingredient in ingredient_group
+            )
+            filters.append(f"""
+        ?recipe food:hasIngredient ?ing{group_idx} .
+        ?ing{group_idx} rdf:type ?ingType{group_idx} .
+        VALUES ?ingType{group_idx} {{ {values} }}
         """)
 
         return "".join(filters)
@@ -109,23 +117,14 @@ class RecipeQueryBuilder:
         }
         order_by = sort_map.get(sort_option, "DESC(?usdascore)")
 
-        query = f"""{RecipeQueryBuilder.PREFIXES}
-    SELECT DISTINCT ?recipe ?name ?usdascore ?calAmount
-    WHERE {{
-        ?recipe a   schema:Recipe ;
-                    schema:name ?name ;
-                    recipeKG:hasUSDAScore ?usdascore . 
-
-        ?recipe recipeKG:hasNutritionalInformation ?nut .
-        ?nut recipeKG:hasCalorificData ?cal .
-        ?cal recipeKG:hasAmount ?calAmount .
-
-        {ingredient_filters}{dietary_filter}    
-    }}
-    ORDER BY {order_by}
-    LIMIT 1000
-        """
-        return query
+        # The inner subquery prunes to the final 1000 recipes before the name
+        # join, so only surviving rows flow through the outer pattern. The
+        # 3-hop nutrition chain is collapsed into a single property path.
+        return RecipeQueryBuilder._QUERY_TEMPLATE.substitute(
+            filters=ingredient_filters,
+            diet=dietary_filter,
+            order_by=order_by,
+        )
 
 
 
@@ -136,7 +135,9 @@ def fetch_recipes_by_ingredients(
 ):
     logger.info("Fetching recipes for ingredient groups: %s, sort: %s", ingredient_groups, sort_option)
     query = RecipeQueryBuilder.build_query(ingredient_groups, dietary_preference, sort_option)
-    logger.debug("SPARQL query: %s", query)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("SPARQL query: %s", query)
     res = execute_query(query)
-    logger.debug("Query returned %d results", len(res.get("results", {}).get("bindings", [])))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Query returned %d results", len(res.get("results", {}).get("bindings", [])))
     return res
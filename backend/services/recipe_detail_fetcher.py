@@ -1,456 +1,794 @@
+import copy
 import logging
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Optional, List, Any
-from urllib.parse import quote
 
-from ..config import execute_query
+from ..config import execute_query, get_dataset_version
+from ..models import RecipeDetail
 
 logger = logging.getLogger(__name__)
 
+# Aggregated RecipeDetail records keyed by (dataset version, URI), LRU-ordered.
+# Detail pages are revisited often and the underlying data only changes on
+# re-ingestion, so a process-local cache saves both the SPARQL round-trip
+# and the aggregation work. The version in the key means bumping the
+# dataset version (see backend.config.set_dataset_version) retires all old
+# entries at once - they stop being hit and the LRU bound evicts them.
+_DETAIL_CACHE: "OrderedDict[tuple, RecipeDetail]" = OrderedDict()
+_DETAIL_CACHE_MAX = 1024
+_DETAIL_CACHE_LOCK = threading.Lock()
 
-class RecipeDetailQueryBuilder:
-    PREFIXES = """
-        PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
-        PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
-        PREFIX schema: <https://schema.org/>
-        PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
-        PREFIX recipeKG: <http://purl.org/recipekg/>
-        PREFIX healsIng: <http://purl.org/heals/ingredient/>
-        PREFIX recipeIng: <http://purl.org/recipekg/ingredient/>
-        PREFIX categories: <http://purl.org/recipekg/categories/>
-        PREFIX food: <http://purl.org/heals/food/>
+# (dataset version, URI) keys the graph answered "no bindings" for.
+# Repeat lookups (stale links, recommender bugs, clients enumerating URIs)
+# short-circuit without a query. A dict is used for its insertion order:
+# when full, the oldest entry is evicted. Query errors are deliberately
+# not recorded here.
+_NEGATIVE_CACHE: Dict[tuple, None] = {}
+_NEGATIVE_CACHE_MAX = 10_000
+
+# The per-facet subqueries are independent, so their HTTP round-trips are
+# overlapped on a shared pool.
+_EXECUTOR = ThreadPoolExecutor(max_workers=5)
+
+
+def _tail(uri: str) -> str:
+    """Return the last path segment of a URI (the whole string if no slash).
+
+    str.rpartition scans once from the right, instead of splitting the full
+    URI into a throwaway list after a separate containment scan.
     """
+    return uri.rpartition("/")[2]
+
+
+def _batchify(template: str) -> str:
+    """Turn a single-recipe facet template into its multi-recipe variant.
+
+    The fixed URI becomes a `?recipe` variable bound by a VALUES clause
+    (filled in per call via the __URIS__ sentinel), and `?recipe` joins the
+    projection so bindings can be regrouped per recipe afterwards.
+    """
+    batched = template.replace("<__URI__>", "?recipe")
+    batched = batched.replace("SELECT DISTINCT\n", "SELECT DISTINCT\n    ?recipe\n", 1)
+    batched = batched.replace("SELECT DISTINCT ?", "SELECT DISTINCT ?recipe ?", 1)
+    return batched.replace("WHERE {\n", "WHERE {\n    VALUES ?recipe { __URIS__ }\n", 1)
+
+
+# The nutrition data properties the detail query asks for, mapped to their
+# (display label, fallback unit). One table, one lookup per binding - the
+# merge loop previously consulted separate display and unit dicts.
+_NUTR_PROPS: Dict[str, tuple] = {
+    "hasCarbohydrateData": ("Carbohydrate", "g"),
+    "hasFatData": ("Fat", "g"),
+    "hasProteinData": ("Protein", "g"),
+    "hasFiberData": ("Fiber", "g"),
+    "hasSugarData": ("Sugar", "g"),
+    "hasSodiumData": ("Sodium", "mg"),
+    "hasCholesterolData": ("Cholesterol", "mg"),
+    "hasSaturatedFatData": ("SaturatedFat", "g"),
+    "hasVitaminAData": ("VitaminA", "µg"),
+    "hasVitaminCData": ("VitaminC", "mg"),
+    "hasCalciumData": ("Calcium", "mg"),
+    "hasIronData": ("Iron", "mg"),
+    "hasZincData": ("Zinc", "mg"),
+    "hasPotassiumData": ("Potassium", "mg"),
+    "hasMagnesiumData": ("Magnesium", "mg"),
+}
+
+# The same property names as a frozenset for O(1) membership checks.
+# Defense in depth: the VALUES clause already restricts what the endpoint
+# can return, but a misbehaving endpoint (or a future query edit) cannot
+# smuggle unexpected rows into nutritional_info. Calories ride along in
+# the nutrition query but surface as RecipeDetail.calories, not as a
+# nutritional_info entry, so they live outside _NUTR_PROPS.
+_ACCEPTED_NUT_PROPS = frozenset(_NUTR_PROPS) | {"hasCalorificData"}
+
+
+class RecipeDetailQueryBuilder:
+    # Kept flush-left: the prefix block is shipped with every query, so no
+    # need to pad each line with indentation bytes.
+    PREFIXES = """\
+PREFIX rdf: <http://www.w3.org/1999/02/22-rdf-syntax-ns#>
+PREFIX rdfs: <http://www.w3.org/2000/01/rdf-schema#>
+PREFIX schema: <https://schema.org/>
+PREFIX xsd: <http://www.w3.org/2001/XMLSchema#>
+PREFIX recipeKG: <http://purl.org/recipekg/>
+PREFIX healsIng: <http://purl.org/heals/ingredient/>
+PREFIX recipeIng: <http://purl.org/recipekg/ingredient/>
+PREFIX categories: <http://purl.org/recipekg/categories/>
+PREFIX food: <http://purl.org/heals/food/>
+"""
+
+    # The facet query skeletons are assembled once at import time with a
+    # __URI__ sentinel (not a format field - SPARQL's braces would all need
+    # escaping), so per-call work is a single str.replace.
+    _SCALAR_TEMPLATE = PREFIXES + """
+SELECT DISTINCT
+    ?name
+    ?usdascore
+    ?fsascore
+    ?description
+    ?recipeYield
+    ?prepTime
+    ?cookTime
+    ?totalTime
+    ?datePublished
+    ?servingSize
+    ?servingSizeUnit
+WHERE {
+    <__URI__> a schema:Recipe .
+
+    OPTIONAL { <__URI__> schema:name ?name . }
+    OPTIONAL { <__URI__> recipeKG:hasUSDAScore ?usdascore . }
+    OPTIONAL { <__URI__> recipeKG:hasFSAScore ?fsascore . }
+    OPTIONAL { <__URI__> schema:description ?description . }
+    OPTIONAL { <__URI__> schema:recipeYield ?recipeYield . }
+    OPTIONAL { <__URI__> schema:prepTime ?prepTime . }
+    OPTIONAL { <__URI__> schema:cookTime ?cookTime . }
+    OPTIONAL { <__URI__> schema:totalTime ?totalTime . }
+    OPTIONAL { <__URI__> schema:datePublished ?datePublished . }
+
+    OPTIONAL {
+        <__URI__> recipeKG:hasNutritionalInformation ?nut .
+        OPTIONAL {
+            ?nut recipeKG:hasServingSize ?servingSize .
+        }
+        OPTIONAL {
+            ?nut recipeKG:hasServingSizeUnit ?servingSizeUnit .
+        }
+    }
+}
+"""
+
+    _INGREDIENTS_TEMPLATE = PREFIXES + """
+SELECT DISTINCT ?ingredientName ?ingredientType ?ingredientQuantity ?ingredientUnit
+WHERE {
+    <__URI__> food:hasIngredient ?ingredient .
+    ?ingredient rdf:type ?ingredientType .
+    OPTIONAL {
+        ?ingredient recipeKG:ingredientName ?ingredientName .
+    }
+    OPTIONAL {
+        ?ingredient recipeKG:hasQuantity ?ingredientQuantity .
+    }
+    OPTIONAL {
+        ?ingredient recipeKG:hasUnit ?ingredientUnit .
+    }
+}
+"""
+
+    _RATING_TEMPLATE = PREFIXES + """
+SELECT DISTINCT ?ratingValue ?ratingCount ?bestRating ?worstRating
+WHERE {
+    <__URI__> schema:aggregateRating ?rating .
+    ?rating schema:ratingValue ?ratingValue .
+    OPTIONAL { ?rating schema:ratingCount ?ratingCount . }
+    OPTIONAL { ?rating schema:bestRating ?bestRating . }
+    OPTIONAL { ?rating schema:worstRating ?worstRating . }
+}
+"""
+
+    _TAXONOMY_TEMPLATE = PREFIXES + """
+SELECT DISTINCT ?dietaryRestriction ?category
+WHERE {
+    {
+        <__URI__> recipeKG:hasDietaryRestriction ?dietaryRestriction .
+    }
+    UNION
+    {
+        <__URI__> recipeKG:belongsTo ?category .
+    }
+}
+"""
+
+    _NUTRITION_TEMPLATE = PREFIXES + """
+SELECT DISTINCT ?nutritionalProperty ?nutritionalAmount ?nutritionalUnit
+WHERE {
+    VALUES ?nutritionalProperty {
+        recipeKG:hasCalorificData
+        recipeKG:hasCarbohydrateData
+        recipeKG:hasFatData
+        recipeKG:hasProteinData
+        recipeKG:hasFiberData
+        recipeKG:hasSugarData
+        recipeKG:hasSodiumData
+        recipeKG:hasCholesterolData
+        recipeKG:hasSaturatedFatData
+        recipeKG:hasVitaminAData
+        recipeKG:hasVitaminCData
+        recipeKG:hasCalciumData
+        recipeKG:hasIronData
+        recipeKG:hasZincData
+        recipeKG:hasPotassiumData
+        recipeKG:hasMagnesiumData
+    }
+    <__URI__> recipeKG:hasNutritionalInformation ?nutInfo .
+    ?nutInfo ?nutritionalProperty ?nutritionalDataNode .
+    ?nutritionalDataNode recipeKG:hasAmount ?nutritionalAmount .
+    OPTIONAL {
+        ?nutritionalDataNode recipeKG:hasUnit ?nutritionalUnit .
+    }
+}
+"""
+
+    _BATCH_TEMPLATES = [
+        _batchify(_SCALAR_TEMPLATE),
+        _batchify(_INGREDIENTS_TEMPLATE),
+        _batchify(_RATING_TEMPLATE),
+        _batchify(_TAXONOMY_TEMPLATE),
+        _batchify(_NUTRITION_TEMPLATE),
+    ]
 
     @staticmethod
-    def build_query(recipe_uri: str) -> str:
-        """Build a comprehensive SPARQL query to fetch all available recipe information."""
-        recipe_uri_escaped = recipe_uri.replace('"', '\\"')
-        
-        query = f"""{RecipeDetailQueryBuilder.PREFIXES}
-    SELECT DISTINCT 
-        ?name 
-        ?usdascore 
-        ?fsascore
-        ?calAmount 
-        ?description
-        ?recipeYield
-        ?prepTime
-        ?cookTime
-        ?totalTime
-        ?datePublished
-        ?ingredientName
-        ?ingredientType
-        ?ingredientQuantity
-        ?ingredientUnit
-        ?dietaryRestriction
-        ?nutritionalProperty
-        ?nutritionalAmount
-        ?nutritionalUnit
-        ?servingSize
-        ?servingSizeUnit
-        ?ratingValue
-        ?ratingCount
-        ?bestRating
-        ?worstRating
-        ?category
-    WHERE {{
-        <{recipe_uri_escaped}> a schema:Recipe .
-        
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:name ?name . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> recipeKG:hasUSDAScore ?usdascore . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> recipeKG:hasFSAScore ?fsascore . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:description ?description . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:recipeYield ?recipeYield . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:prepTime ?prepTime . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:cookTime ?cookTime . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:totalTime ?totalTime . }}
-        OPTIONAL {{ <{recipe_uri_escaped}> schema:datePublished ?datePublished . }}
-        
-        OPTIONAL {{
-            <{recipe_uri_escaped}> food:hasIngredient ?ingredient .
-            ?ingredient rdf:type ?ingredientType .
-            OPTIONAL {{
-                ?ingredient recipeKG:ingredientName ?ingredientName .
-            }}
-            OPTIONAL {{
-                ?ingredient recipeKG:hasQuantity ?ingredientQuantity .
-            }}
-            OPTIONAL {{
-                ?ingredient recipeKG:hasUnit ?ingredientUnit .
-            }}
-        }}
-        
-        OPTIONAL {{
-            <{recipe_uri_escaped}> recipeKG:hasDietaryRestriction ?dietaryRestriction .
-        }}
-        
-        OPTIONAL {{
-            <{recipe_uri_escaped}> recipeKG:belongsTo ?category .
-        }}
-        
-        OPTIONAL {{
-            <{recipe_uri_escaped}> schema:aggregateRating ?rating .
-            ?rating schema:ratingValue ?ratingValue .
-            OPTIONAL {{ ?rating schema:ratingCount ?ratingCount . }}
-            OPTIONAL {{ ?rating schema:bestRating ?bestRating . }}
-            OPTIONAL {{ ?rating schema:worstRating ?worstRating . }}
-        }}
-        
-        OPTIONAL {{
-            <{recipe_uri_escaped}> recipeKG:hasNutritionalInformation ?nut .
-            ?nut recipeKG:hasCalorificData ?cal .
-            ?cal recipeKG:hasAmount ?calAmount .
-            OPTIONAL {{
-                ?nut recipeKG:hasServingSize ?servingSize .
-            }}
-            OPTIONAL {{
-                ?nut recipeKG:hasServingSizeUnit ?servingSizeUnit .
-            }}
-        }}
-        
-        OPTIONAL {{
-            <{recipe_uri_escaped}> recipeKG:hasNutritionalInformation ?nutInfo .
-            ?nutInfo ?nutritionalProperty ?nutritionalDataNode .
-            FILTER (
-                STRSTARTS(STR(?nutritionalProperty), STR(recipeKG:)) &&
-                ?nutritionalProperty != recipeKG:hasCalorificData &&
-                ?nutritionalProperty != recipeKG:hasNutritionalInformation &&
-                (
-                    ?nutritionalProperty = recipeKG:hasCarbohydrateData ||
-                    ?nutritionalProperty = recipeKG:hasFatData ||
-                    ?nutritionalProperty = recipeKG:hasProteinData ||
-                    ?nutritionalProperty = recipeKG:hasFiberData ||
-                    ?nutritionalProperty = recipeKG:hasSugarData ||
-                    ?nutritionalProperty = recipeKG:hasSodiumData ||
-                    ?nutritionalProperty = recipeKG:hasCholesterolData ||
-                    ?nutritionalProperty = recipeKG:hasSaturatedFatData ||
-                    ?nutritionalProperty = recipeKG:hasVitaminAData ||
-                    ?nutritionalProperty = recipeKG:hasVitaminCData ||
-                    ?nutritionalProperty = recipeKG:hasCalciumData ||
-                    ?nutritionalProperty = recipeKG:hasIronData ||
-                    ?nutritionalProperty = recipeKG:hasZincData ||
-                    ?nutritionalProperty = recipeKG:hasPotassiumData ||
-                    ?nutritionalProperty = recipeKG:hasMagnesiumData
-                )
-            )
-            ?nutritionalDataNode recipeKG:hasAmount ?nutritionalAmount .
-            OPTIONAL {{
-                ?nutritionalDataNode recipeKG:hasUnit ?nutritionalUnit .
-            }}
-        }}
-    }}
-    ORDER BY ?ingredientName
-        """
-        return query
-
-
-def fetch_recipe_details(recipe_uri: str) -> Optional[Dict[str, Any]]:
+    def _escape(recipe_uri: str) -> str:
+        return recipe_uri.replace('"', '\\"')
+
+    @staticmethod
+    def build_scalar_query(recipe_uri: str) -> str:
+        """Single-valued fields plus rating and calorie/serving-size data."""
+        return RecipeDetailQueryBuilder._SCALAR_TEMPLATE.replace(
+            "__URI__", RecipeDetailQueryBuilder._escape(recipe_uri)
+        )
+
+    @staticmethod
+    def build_ingredients_query(recipe_uri: str) -> str:
+        return RecipeDetailQueryBuilder._INGREDIENTS_TEMPLATE.replace(
+            "__URI__", RecipeDetailQueryBuilder._escape(recipe_uri)
+        )
+
+    @staticmethod
+    def build_taxonomy_query(recipe_uri: str) -> str:
+        return RecipeDetailQueryBuilder._TAXONOMY_TEMPLATE.replace(
+            "__URI__", RecipeDetailQueryBuilder._escape(recipe_uri)
+        )
+
+    @staticmethod
+    def build_nutrition_query(recipe_uri: str) -> str:
+        return RecipeDetailQueryBuilder._NUTRITION_TEMPLATE.replace(
+            "__URI__", RecipeDetailQueryBuilder._escape(recipe_uri)
+        )
+
+    @staticmethod
+    def build_rating_query(recipe_uri: str) -> str:
+        return RecipeDetailQueryBuilder._RATING_TEMPLATE.replace(
+            "__URI__", RecipeDetailQueryBuilder._escape(recipe_uri)
+        )
+
+    @staticmethod
+    def build_queries(recipe_uri: str) -> List[str]:
+        """All per-facet subqueries, in (scalar, ingredients, rating, taxonomy, nutrition) order."""
+        return [
+            RecipeDetailQueryBuilder.build_scalar_query(recipe_uri),
+            RecipeDetailQueryBuilder.build_ingredients_query(recipe_uri),
+            RecipeDetailQueryBuilder.build_rating_query(recipe_uri),
+            RecipeDetailQueryBuilder.build_taxonomy_query(recipe_uri),
+            RecipeDetailQueryBuilder.build_nutrition_query(recipe_uri),
+        ]
+
+    @staticmethod
+    def build_batch_queries(recipe_uris: List[str]) -> List[str]:
+        """The facet subqueries with every URI bound through one VALUES clause."""
+        values = " ".join(
+            f"<{RecipeDetailQueryBuilder._escape(uri)}>" for uri in recipe_uris
+        )
+        return [
+            template.replace("__URIS__", values)
+            for template in RecipeDetailQueryBuilder._BATCH_TEMPLATES
+        ]
+
+
+def invalidate_recipe_details(recipe_uri: Optional[str] = None) -> None:
+    """Drop one recipe (or, with no argument, all recipes) from the detail
+    cache. For a whole re-ingest, prefer bumping the dataset version via
+    backend.config.set_dataset_version, which retires old entries lazily."""
+    with _DETAIL_CACHE_LOCK:
+        if recipe_uri is None:
+            _DETAIL_CACHE.clear()
+            _NEGATIVE_CACHE.clear()
+        else:
+            key = (get_dataset_version(), recipe_uri)
+            _DETAIL_CACHE.pop(key, None)
+            _NEGATIVE_CACHE.pop(key, None)
+
+
+def _cache_details(recipe_uri: str, recipe_data: RecipeDetail) -> None:
+    """Store a deep copy of `recipe_data`, evicting least-recently-used."""
+    key = (get_dataset_version(), recipe_uri)
+    with _DETAIL_CACHE_LOCK:
+        _DETAIL_CACHE[key] = copy.deepcopy(recipe_data)
+        _DETAIL_CACHE.move_to_end(key)
+        while len(_DETAIL_CACHE) > _DETAIL_CACHE_MAX:
+            _DETAIL_CACHE.popitem(last=False)
+
+
+def _record_missing(recipe_uri: str) -> None:
+    """Remember that `recipe_uri` has no bindings, evicting oldest-first."""
+    key = (get_dataset_version(), recipe_uri)
+    with _DETAIL_CACHE_LOCK:
+        if len(_NEGATIVE_CACHE) >= _NEGATIVE_CACHE_MAX:
+            _NEGATIVE_CACHE.pop(next(iter(_NEGATIVE_CACHE)))
+        _NEGATIVE_CACHE[key] = None
+
+
+def fetch_recipe_details(recipe_uri: str) -> Optional[RecipeDetail]:
     """
     Fetch comprehensive details for a single recipe.
-    
+
+    Results are memoized per URI; deep copies are stored and returned so a
+    caller mutating its result can never corrupt the cached state.
+
     Args:
         recipe_uri: The URI of the recipe to fetch
-        
+
+    Returns:
+        RecipeDetail carrying all recipe information, or None if recipe not found
+    """
+    key = (get_dataset_version(), recipe_uri)
+    with _DETAIL_CACHE_LOCK:
+        cached = _DETAIL_CACHE.get(key)
+        if cached is not None:
+            _DETAIL_CACHE.move_to_end(key)
+        known_missing = cached is None and key in _NEGATIVE_CACHE
+    if cached is not None:
+        logger.debug("Detail cache hit for URI: %s", recipe_uri)
+        return copy.deepcopy(cached)
+    if known_missing:
+        logger.debug("Negative cache hit for URI: %s", recipe_uri)
+        return None
+
+    recipe_data = _fetch_recipe_details_uncached(recipe_uri)
+
+    if recipe_data is not None:
+        _cache_details(recipe_uri, recipe_data)
+    return recipe_data
+
+
+def fetch_recipe_details_batch(recipe_uris: List[str]) -> Dict[str, Optional[RecipeDetail]]:
+    """
+    Fetch details for several recipes with a single round of facet queries.
+
+    Cached recipes are served straight from the detail cache; the misses
+    are bound together through one VALUES clause per facet query, so N
+    recipes cost the same five HTTP round-trips as one.
+
+    Args:
+        recipe_uris: URIs of the recipes to fetch (duplicates are collapsed)
+
     Returns:
-        Dictionary containing all recipe information, or None if recipe not found
+        Dict mapping each input URI to its RecipeDetail, or None for
+        recipes not present in the graph
     """
+    details: Dict[str, Optional[RecipeDetail]] = {}
+    misses: List[str] = []
+
+    version = get_dataset_version()
+    with _DETAIL_CACHE_LOCK:
+        for uri in dict.fromkeys(recipe_uris):
+            key = (version, uri)
+            cached = _DETAIL_CACHE.get(key)
+            if cached is not None:
+                _DETAIL_CACHE.move_to_end(key)
+                details[uri] = copy.deepcopy(cached)
+            elif key in _NEGATIVE_CACHE:
+                details[uri] = None
+            else:
+                misses.append(uri)
+
+    if not misses:
+        return details
+
+    logger.info("Batch-fetching recipe details for %d URIs", len(misses))
+    queries = RecipeDetailQueryBuilder.build_batch_queries(misses)
+
+    try:
+        facet_results = list(_EXECUTOR.map(execute_query, queries))
+    except Exception as e:
+        logger.error("Error batch-fetching recipe details: %s", e, exc_info=True)
+        for uri in misses:
+            details[uri] = None
+        return details
+
+    scalars, ingredients, rating, taxonomy, nutrition = (
+        _group_by_recipe(result["results"]["bindings"]) for result in facet_results
+    )
+
+    for uri in misses:
+        scalar_bindings = scalars.get(uri)
+        if not scalar_bindings:
+            logger.warning("No results found for recipe URI: %s", uri)
+            _record_missing(uri)
+            details[uri] = None
+            continue
+        try:
+            recipe_data = _aggregate_facets(
+                uri,
+                scalar_bindings,
+                ingredients.get(uri, []),
+                rating.get(uri, []),
+                taxonomy.get(uri, []),
+                nutrition.get(uri, []),
+            )
+        except Exception as e:
+            logger.error("Error aggregating recipe details for %s: %s", uri, e, exc_info=True)
+            details[uri] = None
+            continue
+        _cache_details(uri, recipe_data)
+        details[uri] = recipe_data
+
+    return details
+
+
+def _group_by_recipe(bindings: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Partition batch-query bindings by their `?recipe` value."""
+    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for binding in bindings:
+        entry = binding.get("recipe")
+        if entry is not None:
+            grouped[entry["value"]].append(binding)
+    return grouped
+
+
+def _fetch_recipe_details_uncached(recipe_uri: str) -> Optional[RecipeDetail]:
     logger.info("Fetching recipe details for URI: %s", recipe_uri)
-        
-    query = RecipeDetailQueryBuilder.build_query(recipe_uri)
-    logger.debug("SPARQL query: %s", query)
-    
+
+    queries = RecipeDetailQueryBuilder.build_queries(recipe_uri)
+
     try:
-        result = execute_query(query)
-        bindings = result.get("results", {}).get("bindings", [])
-        
-        if not bindings:
+        # Dispatch the facet subqueries concurrently; each returns a small,
+        # uniquely-shaped binding set instead of one cross-product.
+        (
+            scalar_result,
+            ingredients_result,
+            rating_result,
+            taxonomy_result,
+            nutrition_result,
+        ) = list(_EXECUTOR.map(execute_query, queries))
+
+        # SELECT responses always carry results.bindings; index directly
+        # instead of two chained .get calls per facet.
+        scalar_bindings = scalar_result["results"]["bindings"]
+
+        if not scalar_bindings:
             logger.warning("No results found for recipe URI: %s", recipe_uri)
+            _record_missing(recipe_uri)
             return None
-        
-        nutritional_props_found = set()
-        for binding in bindings:
-            if "nutritionalProperty" in binding:
-                prop = binding["nutritionalProperty"]["value"]
-                prop_name = prop.split("/")[-1] if "/" in prop else prop
-                nutritional_props_found.add(prop_name)
-        if nutritional_props_found:
-            logger.info("Found nutritional properties in query results: %s", sorted(nutritional_props_found))
-        
-        recipe_data = {
-            "uri": recipe_uri,
-            "name": None,
-            "description": None,
-            "usda_score": None,
-            "fsa_score": None,
-            "calories": None,
-            "recipe_yield": [],
-            "prep_time": None,
-            "cook_time": None,
-            "total_time": None,
-            "date_published": None,
-            "ingredients": [],
-            "dietary_restrictions": [],
-            "categories": [],
-            "rating": None,
-            "nutritional_info": {},
-            "serving_size": None,
-            "serving_size_unit": None
-        }
-        
-        seen_ingredients = {}  # Changed to dict to track by name and aggregate quantities
-        seen_dietary = set()
-        seen_nutritional = set()
-        seen_yields = set()
-        seen_categories = set()
-        seen_ratings = set()
-        
-        for binding in bindings:
-            if not recipe_data["name"] and "name" in binding:
-                recipe_data["name"] = binding["name"]["value"]
-            
-            if not recipe_data["description"] and "description" in binding:
-                recipe_data["description"] = binding["description"]["value"]
-            
-            if not recipe_data["usda_score"] and "usdascore" in binding:
-                recipe_data["usda_score"] = binding["usdascore"]["value"]
-            
-            if "fsascore" in binding:
-                fsa_value = binding["fsascore"]["value"]
-                if not recipe_data["fsa_score"]:
-                    recipe_data["fsa_score"] = fsa_value
-                elif isinstance(recipe_data["fsa_score"], list):
-                    if fsa_value not in recipe_data["fsa_score"]:
-                        recipe_data["fsa_score"].append(fsa_value)
-                elif recipe_data["fsa_score"] != fsa_value:
-                    recipe_data["fsa_score"] = [recipe_data["fsa_score"], fsa_value]
-            
-            if not recipe_data["calories"] and "calAmount" in binding:
-                recipe_data["calories"] = binding["calAmount"]["value"]
-            
-            if "recipeYield" in binding:
-                yield_value = binding["recipeYield"]["value"]
-                if yield_value not in seen_yields:
-                    seen_yields.add(yield_value)
-                    recipe_data["recipe_yield"].append(yield_value)
-            
-            if not recipe_data["prep_time"] and "prepTime" in binding:
-                recipe_data["prep_time"] = binding["prepTime"]["value"]
-            
-            if not recipe_data["cook_time"] and "cookTime" in binding:
-                recipe_data["cook_time"] = binding["cookTime"]["value"]
-            
-            if not recipe_data["total_time"] and "totalTime" in binding:
-                recipe_data["total_time"] = binding["totalTime"]["value"]
-            
-            if not recipe_data["date_published"] and "datePublished" in binding:
-                recipe_data["date_published"] = binding["datePublished"]["value"]
-            
-            if not recipe_data["serving_size"] and "servingSize" in binding:
-                recipe_data["serving_size"] = binding["servingSize"]["value"]
-            
-            if not recipe_data["serving_size_unit"] and "servingSizeUnit" in binding:
-                unit_value = binding["servingSizeUnit"]["value"]
-                if unit_value.startswith("http://") or unit_value.startswith("https://"):
-                    recipe_data["serving_size_unit"] = unit_value.split("/")[-1] if "/" in unit_value else unit_value
-                else:
-                    recipe_data["serving_size_unit"] = unit_value
-            
-            if "ingredientName" in binding or "ingredientType" in binding:
-                ing_name = None
-                ing_type = None
-                ing_quantity = None
-                ing_unit = None
-                
-                if "ingredientName" in binding:
-                    ing_name = binding["ingredientName"]["value"]
-                elif "ingredientType" in binding:
-                    ing_type = binding["ingredientType"]["value"]
-                    ing_name = ing_type.split("/")[-1] if "/" in ing_type else ing_type
-                
-                if "ingredientType" in binding:
-                    ing_type = binding["ingredientType"]["value"]
-                
-                if "ingredientQuantity" in binding:
-                    ing_quantity = binding["ingredientQuantity"]["value"]
-                
-                if "ingredientUnit" in binding:
-                    ing_unit = binding["ingredientUnit"]["value"]
-                
-                if ing_name:
-                    # Build ingredient display string
-                    parts = []
-                    if ing_quantity:
-                        parts.append(ing_quantity)
-                    if ing_unit:
-                        parts.append(ing_unit)
-                    if ing_name:
-                        parts.append(ing_name)
-                    
-                    display_name = " ".join(parts) if parts else ing_name
-                    
-                    # Use ingredient name as key for aggregation
-                    if ing_name not in seen_ingredients:
-                        seen_ingredients[ing_name] = {
-                            "name": ing_name,
-                            "type": ing_type,
-                            "display": display_name,
-                            "quantities": []
-                        }
-                        if ing_quantity:
-                            seen_ingredients[ing_name]["quantities"].append({
-                                "quantity": ing_quantity,
-                                "unit": ing_unit
-                            })
-                    elif ing_quantity:
-                        # Check if this quantity/unit combo is new
-                        qty_info = {"quantity": ing_quantity, "unit": ing_unit}
-                        if qty_info not in seen_ingredients[ing_name]["quantities"]:
-                            seen_ingredients[ing_name]["quantities"].append(qty_info)
-                            # Update display to show multiple quantities
-                            if len(seen_ingredients[ing_name]["quantities"]) > 1:
-                                qty_strs = []
-                                for q in seen_ingredients[ing_name]["quantities"]:
-                                    qty_parts = [q["quantity"]]
-                                    if q["unit"]:
-                                        qty_parts.append(q["unit"])
-                                    qty_strs.append(" ".join(qty_parts))
-                                seen_ingredients[ing_name]["display"] = f"{', '.join(qty_strs)} {ing_name}"
-                            else:
-                                # Single quantity, update display
-                                seen_ingredients[ing_name]["display"] = display_name
-            
-            if "dietaryRestriction" in binding:
-                dietary = binding["dietaryRestriction"]["value"]
-                dietary_name = dietary.split("/")[-1] if "/" in dietary else dietary
-                if dietary_name not in seen_dietary:
-                    seen_dietary.add(dietary_name)
-                    recipe_data["dietary_restrictions"].append(dietary_name)
-            
-            if "category" in binding:
-                category = binding["category"]["value"]
-                category_name = category.split("/")[-1] if "/" in category else category
-                # Clean up category name (remove trailing slashes, replace hyphens with spaces)
-                category_name = category_name.rstrip("/").replace("-", " ").title()
-                if category_name and category_name not in seen_categories:
-                    seen_categories.add(category_name)
-                    recipe_data["categories"].append(category_name)
-            
-            if "ratingValue" in binding:
-                rating_key = binding["ratingValue"]["value"]
-                if rating_key not in seen_ratings:
-                    seen_ratings.add(rating_key)
-                    rating_data = {
-                        "value": float(binding["ratingValue"]["value"]),
-                        "count": None,
-                        "best": None,
-                        "worst": None
-                    }
-                    if "ratingCount" in binding:
-                        rating_data["count"] = int(binding["ratingCount"]["value"])
-                    if "bestRating" in binding:
-                        rating_data["best"] = float(binding["bestRating"]["value"])
-                    if "worstRating" in binding:
-                        rating_data["worst"] = float(binding["worstRating"]["value"])
-                    recipe_data["rating"] = rating_data
-            
-            if "nutritionalProperty" in binding and "nutritionalAmount" in binding:
-                prop = binding["nutritionalProperty"]["value"]
-                prop_name = prop.split("/")[-1] if "/" in prop else prop
-                amount_value = binding["nutritionalAmount"]["value"]
-                
-                nutritional_key = (prop_name, amount_value)
-                
-                if nutritional_key not in seen_nutritional:
-                    seen_nutritional.add(nutritional_key)
-                    
-                    display_name = prop_name.replace("has", "").replace("Data", "")
-                    if not display_name:
-                        display_name = prop_name
-                    
-                    logger.debug("Processing nutritional property: %s -> display_name: %s, amount: %s", 
-                                prop_name, display_name, amount_value)
-                    
-                    unit = None
-                    if "nutritionalUnit" in binding:
-                        unit_value = binding["nutritionalUnit"]["value"]
-                        if unit_value.startswith("http://") or unit_value.startswith("https://"):
-                            unit = unit_value.split("/")[-1] if "/" in unit_value else unit_value
-                        else:
-                            unit = unit_value
-                    
-                    if not unit:
-                        unit_map = {
-                            "Carbohydrate": "g",
-                            "Fat": "g",
-                            "Protein": "g",
-                            "Fiber": "g",
-                            "Sugar": "g",
-                            "SaturatedFat": "g",
-                            "Sodium": "mg",
-                            "Cholesterol": "mg",
-                            "VitaminA": "µg",
-                            "VitaminC": "mg",
-                            "Calcium": "mg",
-                            "Iron": "mg",
-                            "Zinc": "mg",
-                            "Potassium": "mg",
-                            "Magnesium": "mg"
-                        }
-                        unit = unit_map.get(display_name, "")
-                    
-                    if unit:
-                        formatted_value = f"{amount_value} {unit}"
-                    else:
-                        formatted_value = amount_value
-                    
-                    if display_name not in recipe_data["nutritional_info"]:
-                        recipe_data["nutritional_info"][display_name] = formatted_value
-                        logger.debug("Added nutritional info: %s = %s", display_name, formatted_value)
-                    else:
-                        logger.debug("Skipping duplicate nutritional info: %s (already have: %s)", 
-                                    display_name, recipe_data["nutritional_info"][display_name])
-        
-        # Convert ingredients dict to list
-        recipe_data["ingredients"] = [
-            {
-                "name": ing["name"],
-                "type": ing["type"],
-                "display": ing["display"]
-            }
-            for ing in seen_ingredients.values()
-        ]
-        
-        # Format recipe yield - join multiple yields or use single value
-        if recipe_data["recipe_yield"]:
-            if len(recipe_data["recipe_yield"]) == 1:
-                recipe_data["recipe_yield"] = recipe_data["recipe_yield"][0]
-            else:
-                recipe_data["recipe_yield"] = " or ".join(recipe_data["recipe_yield"])
-        else:
-            recipe_data["recipe_yield"] = None
-        
-        # Format FSA score - join multiple scores or use single value
-        if isinstance(recipe_data["fsa_score"], list):
-            if len(recipe_data["fsa_score"]) == 1:
-                recipe_data["fsa_score"] = recipe_data["fsa_score"][0]
-            else:
-                recipe_data["fsa_score"] = ", ".join(map(str, recipe_data["fsa_score"]))
-        
-        if recipe_data["serving_size"] and recipe_data["serving_size_unit"]:
-            recipe_data["nutritional_context"] = f"per {recipe_data['serving_size']} {recipe_data['serving_size_unit']}"
-        elif recipe_data["recipe_yield"]:
-            recipe_data["nutritional_context"] = f"per serving (recipe yields {recipe_data['recipe_yield']})"
-        else:
-            recipe_data["nutritional_context"] = "per serving"
-        
-        if recipe_data["nutritional_info"]:
-            logger.info("Final nutritional info to display: %s", sorted(recipe_data["nutritional_info"].keys()))
-        else:
-            logger.warning("No nutritional info found for recipe: %s", recipe_uri)
-        
-        logger.debug("Recipe data aggregated: %s", recipe_data)
-        return recipe_data
-        
+
+        return _aggregate_facets(
+            recipe_uri,
+            scalar_bindings,
+            ingredients_result["results"]["bindings"],
+            rating_result["results"]["bindings"],
+            taxonomy_result["results"]["bindings"],
+            nutrition_result["results"]["bindings"],
+        )
+
     except Exception as e:
         logger.error("Error fetching recipe details: %s", e, exc_info=True)
         return None
 
+
+def _aggregate_facets(
+    recipe_uri: str,
+    scalar_bindings: List[Dict[str, Any]],
+    ingredient_bindings: List[Dict[str, Any]],
+    rating_bindings: List[Dict[str, Any]],
+    taxonomy_bindings: List[Dict[str, Any]],
+    nutrition_bindings: List[Dict[str, Any]],
+) -> RecipeDetail:
+    """Fold the facet binding sets into one RecipeDetail record."""
+    recipe_data = RecipeDetail(uri=recipe_uri)
+
+    _merge_scalars(scalar_bindings, recipe_data)
+    _merge_ingredients(ingredient_bindings, recipe_data)
+    _merge_rating(rating_bindings, recipe_data)
+    _merge_taxonomy(taxonomy_bindings, recipe_data)
+    _merge_nutrition(nutrition_bindings, recipe_data)
+
+    # Format recipe yield - join multiple yields or use single value
+    if recipe_data.recipe_yield:
+        if len(recipe_data.recipe_yield) == 1:
+            recipe_data.recipe_yield = recipe_data.recipe_yield[0]
+        else:
+            recipe_data.recipe_yield = " or ".join(recipe_data.recipe_yield)
+    else:
+        recipe_data.recipe_yield = None
+
+    # Format FSA score - join multiple scores or use single value
+    if isinstance(recipe_data.fsa_score, list):
+        if len(recipe_data.fsa_score) == 1:
+            recipe_data.fsa_score = recipe_data.fsa_score[0]
+        else:
+            recipe_data.fsa_score = ", ".join(map(str, recipe_data.fsa_score))
+
+    if recipe_data.serving_size and recipe_data.serving_size_unit:
+        recipe_data.nutritional_context = f"per {recipe_data.serving_size} {recipe_data.serving_size_unit}"
+    elif recipe_data.recipe_yield:
+        recipe_data.nutritional_context = f"per serving (recipe yields {recipe_data.recipe_yield})"
+    else:
+        recipe_data.nutritional_context = "per serving"
+
+    if recipe_data.nutritional_info:
+        logger.info("Final nutritional info to display: %s", sorted(recipe_data.nutritional_info.keys()))
+    else:
+        logger.warning("No nutritional info found for recipe: %s", recipe_uri)
+
+    # Guarded: rendering the full dict repr is far more expensive than the
+    # aggregation it reports on.
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Recipe data aggregated: %s", recipe_data)
+    return recipe_data
+
+
+def _merge_scalars(bindings: List[Dict[str, Any]], recipe_data: RecipeDetail) -> None:
+    """Fold the scalar-query bindings into `recipe_data`.
+
+    The truly single-valued fields ("first binding wins") are read once from
+    the first binding instead of being re-checked on every row; only
+    recipeYield and fsascore, which can legitimately repeat across rows,
+    are folded in the full loop.
+    """
+    if not bindings:
+        return
+
+    first = bindings[0]
+    for var, key in (
+        ("name", "name"),
+        ("description", "description"),
+        ("usdascore", "usda_score"),
+        ("prepTime", "prep_time"),
+        ("cookTime", "cook_time"),
+        ("totalTime", "total_time"),
+        ("datePublished", "date_published"),
+        ("servingSize", "serving_size"),
+    ):
+        # .get instead of "in" + indexing: one hash lookup per key.
+        entry = first.get(var)
+        if entry is not None:
+            setattr(recipe_data, key, entry["value"])
+
+    entry = first.get("servingSizeUnit")
+    if entry is not None:
+        unit_value = entry["value"]
+        if unit_value.startswith(("http://", "https://")):
+            recipe_data.serving_size_unit = _tail(unit_value)
+        else:
+            recipe_data.serving_size_unit = unit_value
+
+    seen_yields = set()
+    # Accumulate FSA scores flat (insertion-ordered dedupe) instead of the
+    # old scalar/list state machine that reallocated on every transition
+    # and linear-scanned the list per row.
+    fsa_scores: Dict[str, None] = {}
+
+    for binding in bindings:
+        entry = binding.get("fsascore")
+        if entry is not None:
+            fsa_scores[entry["value"]] = None
+
+        entry = binding.get("recipeYield")
+        if entry is not None:
+            yield_value = entry["value"]
+            if yield_value not in seen_yields:
+                seen_yields.add(yield_value)
+                recipe_data.recipe_yield.append(yield_value)
+
+    if fsa_scores:
+        scores = list(fsa_scores)
+        recipe_data.fsa_score = scores[0] if len(scores) == 1 else scores
+
+
+def _merge_rating(bindings: List[Dict[str, Any]], recipe_data: RecipeDetail) -> None:
+    """Fold the rating-query bindings into `recipe_data` (last rating wins)."""
+    seen_ratings = set()
+
+    for binding in bindings:
+        value_entry = binding.get("ratingValue")
+        if value_entry is not None:
+            rating_key = value_entry["value"]
+            if rating_key not in seen_ratings:
+                seen_ratings.add(rating_key)
+                rating_data = {
+                    "value": float(rating_key),
+                    "count": None,
+                    "best": None,
+                    "worst": None
+                }
+                entry = binding.get("ratingCount")
+                if entry is not None:
+                    rating_data["count"] = int(entry["value"])
+                entry = binding.get("bestRating")
+                if entry is not None:
+                    rating_data["best"] = float(entry["value"])
+                entry = binding.get("worstRating")
+                if entry is not None:
+                    rating_data["worst"] = float(entry["value"])
+                recipe_data.rating = rating_data
+
+
+def _merge_ingredients(bindings: List[Dict[str, Any]], recipe_data: RecipeDetail) -> None:
+    """Fold the ingredients-query bindings into `recipe_data`.
+
+    Aggregation is column-wise: parallel name/type/display lists plus an
+    index dict, instead of allocating a per-ingredient dict up front. The
+    list-of-dicts shape the templates expect is materialized once at the
+    end, after all duplicate rows have been folded.
+    """
+    names: List[str] = []
+    types: List[Optional[str]] = []
+    displays: List[str] = []
+    # Working columns, not emitted: seen (quantity, unit) pairs and the
+    # incrementally-grown joined quantity prefix of the display string.
+    quantities: List[List[tuple]] = []
+    suffixes: List[str] = []
+    index: Dict[str, int] = {}
+
+    for binding in bindings:
+        name_entry = binding.get("ingredientName")
+        type_entry = binding.get("ingredientType")
+        if name_entry is None and type_entry is None:
+            continue
+
+        ing_type = type_entry["value"] if type_entry is not None else None
+
+        if name_entry is not None:
+            ing_name = name_entry["value"]
+        else:
+            ing_name = _tail(ing_type)
+
+        qty_entry = binding.get("ingredientQuantity")
+        ing_quantity = qty_entry["value"] if qty_entry is not None else None
+
+        unit_entry = binding.get("ingredientUnit")
+        ing_unit = unit_entry["value"] if unit_entry is not None else None
+
+        if not ing_name:
+            continue
+
+        # Build ingredient display string
+        parts = []
+        if ing_quantity:
+            parts.append(ing_quantity)
+        if ing_unit:
+            parts.append(ing_unit)
+        if ing_name:
+            parts.append(ing_name)
+
+        display_name = " ".join(parts) if parts else ing_name
+
+        # Use ingredient name as key for aggregation
+        i = index.get(ing_name)
+        if i is None:
+            index[ing_name] = len(names)
+            names.append(ing_name)
+            types.append(ing_type)
+            displays.append(display_name)
+            if ing_quantity:
+                quantities.append([(ing_quantity, ing_unit)])
+                suffixes.append(
+                    f"{ing_quantity} {ing_unit}" if ing_unit else ing_quantity
+                )
+            else:
+                quantities.append([])
+                suffixes.append("")
+        elif ing_quantity:
+            # Check if this quantity/unit combo is new
+            qty_info = (ing_quantity, ing_unit)
+            if qty_info not in quantities[i]:
+                quantities[i].append(qty_info)
+                qty_str = f"{ing_quantity} {ing_unit}" if ing_unit else ing_quantity
+                if suffixes[i]:
+                    # Grow the cached joined prefix instead of re-joining
+                    # every recorded quantity on each new variant.
+                    suffixes[i] += f", {qty_str}"
+                    displays[i] = f"{suffixes[i]} {ing_name}"
+                else:
+                    # First quantity for this ingredient; the row's own
+                    # display string already includes it.
+                    suffixes[i] = qty_str
+                    displays[i] = display_name
+
+    # Sorted here rather than via ORDER BY in the query: the store would
+    # sort every joined row, while Python sorts the deduplicated set.
+    recipe_data.ingredients = sorted(
+        (
+            {"name": name, "type": ing_type, "display": display}
+            for name, ing_type, display in zip(names, types, displays)
+        ),
+        key=lambda ing: ing["name"],
+    )
+
+
+def _merge_taxonomy(bindings: List[Dict[str, Any]], recipe_data: RecipeDetail) -> None:
+    """Fold the dietary-restriction and category bindings into `recipe_data`."""
+    # Dicts dedupe while preserving first-seen order, so no shadow seen_*
+    # sets holding a second copy of every name.
+    dietary_names: Dict[str, None] = {}
+    category_names: Dict[str, None] = {}
+
+    for binding in bindings:
+        entry = binding.get("dietaryRestriction")
+        if entry is not None:
+            dietary_names[_tail(entry["value"])] = None
+
+        entry = binding.get("category")
+        if entry is not None:
+            category_name = _tail(entry["value"])
+            # Clean up category name (remove trailing slashes, replace hyphens with spaces)
+            category_name = category_name.rstrip("/").replace("-", " ").title()
+            if category_name:
+                category_names[category_name] = None
+
+    recipe_data.dietary_restrictions.extend(dietary_names)
+    recipe_data.categories.extend(category_names)
+
+
+def _merge_nutrition(bindings: List[Dict[str, Any]], recipe_data: RecipeDetail) -> None:
+    """Fold the nutrition-query bindings into `recipe_data`."""
+    # Collected inside the main loop (no dedicated logging pre-pass) and
+    # reported after it.
+    nutritional_props_found = set()
+    seen_nutritional = set()
+    # Checked once, not per binding: the debug calls below format their
+    # arguments even when the level is off.
+    debug = logger.isEnabledFor(logging.DEBUG)
+
+    for binding in bindings:
+        prop_entry = binding.get("nutritionalProperty")
+        amount_entry = binding.get("nutritionalAmount")
+        if prop_entry is None or amount_entry is None:
+            continue
+
+        prop_name = _tail(prop_entry["value"])
+        nutritional_props_found.add(prop_name)
+        if prop_name not in _ACCEPTED_NUT_PROPS:
+            continue
+        amount_value = amount_entry["value"]
+
+        # Calories share the nutrition query (one OPTIONAL block less on
+        # the scalar query) but are a top-level field, not a table row.
+        if prop_name == "hasCalorificData":
+            if not recipe_data.calories:
+                recipe_data.calories = amount_value
+            continue
+
+        nutritional_key = (prop_name, amount_value)
+
+        if nutritional_key in seen_nutritional:
+            continue
+        seen_nutritional.add(nutritional_key)
+
+        # Always present: the whitelist above is built from this table.
+        display_name, default_unit = _NUTR_PROPS[prop_name]
+
+        if debug:
+            logger.debug("Processing nutritional property: %s -> display_name: %s, amount: %s",
+                        prop_name, display_name, amount_value)
+
+        unit = None
+        unit_entry = binding.get("nutritionalUnit")
+        if unit_entry is not None:
+            unit_value = unit_entry["value"]
+            if unit_value.startswith(("http://", "https://")):
+                unit = _tail(unit_value)
+            else:
+                unit = unit_value
+
+        if not unit:
+            unit = default_unit
+
+        if unit:
+            formatted_value = f"{amount_value} {unit}"
+        else:
+            formatted_value = amount_value
+
+        if display_name not in recipe_data.nutritional_info:
+            recipe_data.nutritional_info[display_name] = formatted_value
+            if debug:
+                logger.debug("Added nutritional info: %s = %s", display_name, formatted_value)
+        elif debug:
+            logger.debug("Skipping duplicate nutritional info: %s (already have: %s)",
+                        display_name, recipe_data.nutritional_info[display_name])
+
+    if nutritional_props_found:
+        logger.info("Found nutritional properties in query results: %s", sorted(nutritional_props_found))